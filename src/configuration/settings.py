@@ -1,4 +1,5 @@
 import json
+import re
 from pathlib import Path
 from typing import TypedDict
 
@@ -14,6 +15,23 @@ class TextModifyingSettings(TypedDict):
     ADD_CHARACTER: str
 
 
+class AccessLogSettings(TypedDict):
+    ENABLED: bool
+    FILE_PATH: str
+    BUFFER_SIZE: int
+    BATCH_SIZE: int
+    FLUSH_INTERVAL: float
+    MAX_BYTES: int
+    BACKUP_COUNT: int
+
+
+SECTIONS: dict[str, type] = {
+    'PROXY_SERVER': ProxyServerSettings,
+    'TEXT_MODIFYING': TextModifyingSettings,
+    'ACCESS_LOG': AccessLogSettings,
+}
+
+
 class Settings:
     """Represents settings of the project."""
 
@@ -28,9 +46,121 @@ class Settings:
         return cls(config_data)
 
     def __init__(self, config_dict: dict):
+        self.load(config_dict)
+
+    def load(self, config_dict: dict):
+        """
+        Replaces the current configuration with the passed one. The instance
+        is changed in place, so modules which have imported it see new values.
+        Raises an error if the config or its sections aren't json objects.
+        """
+        if not isinstance(config_dict, dict):
+            raise ValueError("The config must be a json object.")
+        for section in SECTIONS:
+            if not isinstance(config_dict.get(section, {}), dict):
+                raise ValueError(f"The `{section}` section of the config must be a json object.")
         self.config = config_dict
         self.proxy_settings: ProxyServerSettings = self.config.get('PROXY_SERVER', {})
         self.text_modifying: TextModifyingSettings = self.config.get('TEXT_MODIFYING', {})
+        self.access_log: AccessLogSettings = self.config.get('ACCESS_LOG', {})
+
+    def load_file(self, file_path: str | Path):
+        """Replaces the current configuration with data of the config json-file."""
+        with open(file_path) as file:
+            self.load(json.load(file))
+
+    def apply_overrides(self, overrides: list[str]):
+        """
+        Applies overrides in the `SECTION.KEY=VALUE` format. The value is
+        parsed as json, and if it fails, is used as a string. Only known
+        sections and keys can be overridden.
+        """
+        for override in overrides:
+            option, separator, raw_value = override.partition('=')
+            section, dot, key = option.partition('.')
+            if not (separator and dot and section and key):
+                raise ValueError(f"`{override}` is a wrong override, use the `SECTION.KEY=VALUE` format.")
+            if section not in SECTIONS:
+                raise ValueError(f"`{section}` is an unknown section, use one of: {', '.join(SECTIONS)}.")
+            if key not in SECTIONS[section].__annotations__:
+                raise ValueError(
+                    f"`{section}.{key}` is an unknown setting, "
+                    f"use one of: {', '.join(SECTIONS[section].__annotations__)}."
+                )
+            try:
+                value = json.loads(raw_value)
+            except json.JSONDecodeError:
+                value = raw_value
+            self.config.setdefault(section, {})[key] = value
+        self.load(self.config)
+
+    def validate(self):
+        """Checks that all required values are present and correct, otherwise raises an error."""
+        errors = [
+            *self._validate_proxy_settings(),
+            *self._validate_text_modifying(),
+            *self._validate_access_log(),
+        ]
+        if errors:
+            raise ValueError(' '.join(errors))
+
+    def _validate_proxy_settings(self) -> list[str]:
+        """Returns errors of the `PROXY_SERVER` section."""
+        errors = []
+        host = self.proxy_settings.get('HOST')
+        if not isinstance(host, str) or not host:
+            errors.append("`PROXY_SERVER.HOST` must be a non-empty string.")
+        port = self.proxy_settings.get('PORT')
+        if not is_integer(port) or not 1 <= port <= 65535:
+            errors.append("`PROXY_SERVER.PORT` must be an integer from 1 to 65535.")
+        requested_url = self.proxy_settings.get('REQUESTED_URL')
+        if not isinstance(requested_url, str) or not re.fullmatch(r'https?://[^/\s]+', requested_url.strip()):
+            errors.append(
+                "`PROXY_SERVER.REQUESTED_URL` must be an url like `https://example.com` without a trailing slash."
+            )
+        return errors
+
+    def _validate_text_modifying(self) -> list[str]:
+        """Returns errors of the `TEXT_MODIFYING` section."""
+        errors = []
+        words_length = self.text_modifying.get('WORDS_LENGTH')
+        if not is_integer(words_length) or words_length <= 0:
+            errors.append("`TEXT_MODIFYING.WORDS_LENGTH` must be a positive integer.")
+        if not isinstance(self.text_modifying.get('ADD_CHARACTER'), str):
+            errors.append("`TEXT_MODIFYING.ADD_CHARACTER` must be a string.")
+        return errors
+
+    def _validate_access_log(self) -> list[str]:
+        """
+        Returns errors of the `ACCESS_LOG` section. Absent numeric values
+        aren't checked, because they have defaults.
+        """
+        errors = []
+        if self.access_log.get('ENABLED') and not self.access_log.get('FILE_PATH'):
+            errors.append("`ACCESS_LOG.FILE_PATH` must be set if the access log is enabled.")
+        for key in ('BUFFER_SIZE', 'BATCH_SIZE'):
+            if key in self.access_log and not (is_integer(self.access_log[key]) and self.access_log[key] > 0):
+                errors.append(f"`ACCESS_LOG.{key}` must be a positive integer.")
+        flush_interval = self.access_log.get('FLUSH_INTERVAL', 1.0)
+        if not (is_number(flush_interval) and flush_interval > 0):
+            errors.append("`ACCESS_LOG.FLUSH_INTERVAL` must be a positive number.")
+        for key in ('MAX_BYTES', 'BACKUP_COUNT'):
+            if key in self.access_log and not (is_integer(self.access_log[key]) and self.access_log[key] >= 0):
+                errors.append(f"`ACCESS_LOG.{key}` must be a non-negative integer.")
+        return errors
+
+
+def is_integer(value) -> bool:
+    """Checks whether the value is an integer, but not a boolean."""
+    return isinstance(value, int) and not isinstance(value, bool)
+
+
+def is_number(value) -> bool:
+    """Checks whether the value is an integer or a float, but not a boolean."""
+    return is_integer(value) or isinstance(value, float)
+
 
+DEFAULT_CONFIG_PATH = Path(__file__).parent / 'config.json'
 
-settings = Settings.read_config_file(Path(__file__).parent / 'config.json')
+# The settings are empty until the entry point loads a config file into them.
+settings = Settings({})
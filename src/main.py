@@ -1,19 +1,103 @@
-from configuration.settings import settings
-from proxy.handlers import ProxyHandler
-from proxy.server import ProxyServer
+import time
 
+# Taken before other imports to include their cost in the startup metrics.
+STARTED_AT = time.perf_counter()
 
-def main():
+import argparse  # noqa: E402
+import signal  # noqa: E402
+import threading  # noqa: E402
+
+from configuration.settings import settings, DEFAULT_CONFIG_PATH  # noqa: E402
+from proxy.access_log import AccessLogWriter  # noqa: E402
+from proxy.handlers import ProxyHandler, warm_up  # noqa: E402
+from proxy.server import ProxyServer  # noqa: E402
+
+ACCESS_LOG_OPTIONS = {
+    'BUFFER_SIZE': 'buffer_size',
+    'BATCH_SIZE': 'batch_size',
+    'FLUSH_INTERVAL': 'flush_interval',
+    'MAX_BYTES': 'max_bytes',
+    'BACKUP_COUNT': 'backup_count',
+}
+
+
+def get_arguments_parser() -> argparse.ArgumentParser:
+    """Returns the parser of the command line arguments."""
+    parser = argparse.ArgumentParser(description='Starts the forward proxy.')
+    parser.add_argument(
+        '-c', '--config', default=DEFAULT_CONFIG_PATH,
+        help='Path to the config json-file.',
+    )
+    parser.add_argument(
+        '-s', '--set', dest='overrides', action='append', default=[], metavar='SECTION.KEY=VALUE',
+        help='Overrides the config value, e.g. `PROXY_SERVER.PORT=9000`. Can be used several times.',
+    )
+    parser.add_argument(
+        '--warm-up', action='store_true',
+        help='Imports heavy dependencies, compiles rewrite rules and connects to the remote server '
+             'before accepting traffic.',
+    )
+    parser.add_argument(
+        '--check', action='store_true',
+        help='Validates the config and exits.',
+    )
+    return parser
+
+
+def get_access_log() -> AccessLogWriter | None:
+    """Returns the access log writer if it is enabled in the settings."""
+    if not settings.access_log.get('ENABLED'):
+        return None
+    options = {
+        option: settings.access_log[key]
+        for key, option in ACCESS_LOG_OPTIONS.items()
+        if key in settings.access_log
+    }
+    return AccessLogWriter(settings.access_log['FILE_PATH'], **options)
+
+
+def serve_until_terminated(server: ProxyServer):
+    """
+    Serves requests in the background thread until the process receives
+    SIGTERM or SIGINT and then shuts the server down gracefully.
+    """
+    terminated = threading.Event()
+    for signal_number in (signal.SIGTERM, signal.SIGINT):
+        signal.signal(signal_number, lambda signum, frame: terminated.set())
+    server_thread = threading.Thread(target=server.serve_forever, name='proxy-server')
+    server_thread.start()
+    terminated.wait()
+    server.shutdown()
+    server_thread.join()
+
+
+def main(argv: list[str] | None = None):
     """Starts the forward proxy and handles incoming requests."""
+    parser = get_arguments_parser()
+    arguments = parser.parse_args(argv)
+    try:
+        settings.load_file(arguments.config)
+        settings.apply_overrides(arguments.overrides)
+        settings.validate()
+    except (OSError, ValueError) as error:
+        parser.error(str(error))
+    if arguments.check:
+        return
+
+    if arguments.warm_up:
+        warm_up()
+
     proxy_server = ProxyServer(
         (
             settings.proxy_settings['HOST'],
             settings.proxy_settings['PORT']
         ),
         ProxyHandler,
+        access_log=get_access_log(),
+        started_at=STARTED_AT,
     )
     with proxy_server as server:
-        server.serve_forever()
+        serve_until_terminated(server)
 
 
 if __name__ == '__main__':
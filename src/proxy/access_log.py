@@ -0,0 +1,185 @@
+import json
+import os
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+from pathlib import Path
+from typing import NamedTuple, Iterator
+
+
+class AccessLogRecord(NamedTuple):
+    time: float
+    method: str | None
+    url: str | None
+    status: int | None
+    bytes_in: int
+    bytes_out: int
+    rewrite_applied: bool
+    timings: dict
+    cache_status: str = 'NONE'
+
+
+class StageTimer:
+    """The class measures the duration of the request handling stages."""
+
+    def __init__(self):
+        self.timings: dict[str, float] = {}
+
+    @contextmanager
+    def stage(self, name: str) -> Iterator[None]:
+        """Measures the duration of the stage in milliseconds."""
+        started_at = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.timings[name] = round((time.perf_counter() - started_at) * 1000, 3)
+
+
+class AccessLogWriter:
+    """
+    The class writes access log records as JSON lines in the background
+    thread, so the request handling never waits for the file I/O.
+    """
+
+    def __init__(
+            self,
+            file_path: str | Path,
+            buffer_size: int = 4096,
+            batch_size: int = 256,
+            flush_interval: float = 1.0,
+            max_bytes: int = 10 * 1024 * 1024,
+            backup_count: int = 3,
+    ):
+        if buffer_size <= 0 or batch_size <= 0:
+            raise ValueError("`buffer_size` and `batch_size` must be positive integers.")
+        if flush_interval <= 0:
+            raise ValueError("`flush_interval` must be a positive number.")
+        self.file_path = Path(file_path)
+        self.buffer_size = buffer_size
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.max_bytes = max_bytes
+        self.backup_count = backup_count
+        self.dropped_records = 0
+        self._buffer: deque[AccessLogRecord] = deque(maxlen=buffer_size)
+        self._not_reported_drops = 0
+        self._condition = threading.Condition()
+        self._is_running = False
+        self._thread: threading.Thread | None = None
+
+    def __enter__(self) -> 'AccessLogWriter':
+        self.start()
+        return self
+
+    def __exit__(self, *args):
+        self.stop()
+
+    def log(self, record: AccessLogRecord):
+        """
+        Puts the record to the ring buffer. If the buffer is full, the oldest
+        record is overwritten and counted as dropped.
+        """
+        with self._condition:
+            if len(self._buffer) == self.buffer_size:
+                self.dropped_records += 1
+                self._not_reported_drops += 1
+            self._buffer.append(record)
+            if len(self._buffer) >= self.batch_size:
+                self._condition.notify()
+
+    def start(self):
+        """Starts the background writer thread."""
+        if self._is_running:
+            return
+        self._is_running = True
+        self._thread = threading.Thread(target=self._run, name='access-log-writer', daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        """
+        Stops the background writer and flushes remaining records. Records
+        which can't be written are counted as dropped.
+        """
+        if not self._is_running:
+            return
+        with self._condition:
+            self._is_running = False
+            self._condition.notify()
+        self._thread.join()
+        self.flush()
+        with self._condition:
+            self.dropped_records += len(self._buffer)
+            self._buffer.clear()
+
+    def flush(self):
+        """
+        Writes all buffered records to the log file. If the file can't be
+        written, the batch is counted as dropped and the rest of records
+        wait for the next flush.
+        """
+        while True:
+            records, dropped = self._take_batch()
+            if not records and not dropped:
+                return
+            lines = [self.serialize_record(record) for record in records]
+            if dropped:
+                lines.append(json.dumps({'time': time.time(), 'event': 'dropped', 'count': dropped}))
+            try:
+                self._write_batch(lines)
+            except OSError:
+                with self._condition:
+                    self.dropped_records += len(records)
+                    self._not_reported_drops += dropped + len(records)
+                return
+
+    def _run(self):
+        """Flushes batches of records until the writer is stopped."""
+        while self._is_running:
+            with self._condition:
+                if self._is_running and len(self._buffer) < self.batch_size:
+                    self._condition.wait(self.flush_interval)
+            self.flush()
+
+    def _take_batch(self) -> tuple[list[AccessLogRecord], int]:
+        """
+        Removes a batch of records from the buffer and returns it along with
+        the number of dropped records which aren't reported yet.
+        """
+        with self._condition:
+            records = [self._buffer.popleft() for _ in range(min(self.batch_size, len(self._buffer)))]
+            dropped, self._not_reported_drops = self._not_reported_drops, 0
+        return records, dropped
+
+    @staticmethod
+    def serialize_record(record: AccessLogRecord) -> str:
+        """Returns the record as a JSON line."""
+        return json.dumps(record._asdict(), ensure_ascii=False)
+
+    def _write_batch(self, lines: list[str]):
+        """Writes lines to the log file, rotating it if the size limit is reached."""
+        data = ('\n'.join(lines) + '\n').encode()
+        if self._should_rotate(len(data)):
+            self._rotate()
+        with open(self.file_path, 'ab') as file:
+            file.write(data)
+
+    def _should_rotate(self, incoming_bytes: int) -> bool:
+        """Checks whether the log file exceeds the size limit after writing."""
+        if self.max_bytes <= 0 or not self.file_path.exists():
+            return False
+        return self.file_path.stat().st_size + incoming_bytes > self.max_bytes
+
+    def _rotate(self):
+        """
+        Shifts backup files (`access.log.1` -> `access.log.2` and so on) and
+        moves the current log file to the first backup.
+        """
+        if self.backup_count <= 0:
+            self.file_path.unlink(missing_ok=True)
+            return
+        for index in range(self.backup_count - 1, 0, -1):
+            source = self.file_path.with_name(f"{self.file_path.name}.{index}")
+            if source.exists():
+                os.replace(source, self.file_path.with_name(f"{self.file_path.name}.{index + 1}"))
+        os.replace(self.file_path, self.file_path.with_name(f"{self.file_path.name}.1"))
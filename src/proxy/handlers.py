@@ -1,13 +1,17 @@
 import re
+import time
+from functools import cache
+from http.cookiejar import DefaultCookiePolicy
 from socketserver import StreamRequestHandler
-from typing import NamedTuple, Mapping, BinaryIO
-
-import requests
-from bs4 import BeautifulSoup
-from requests import Response
-from requests.structures import CaseInsensitiveDict
+from typing import NamedTuple, Mapping, BinaryIO, TYPE_CHECKING
 
 from configuration.settings import settings
+from proxy.access_log import AccessLogRecord, StageTimer
+from proxy.server import report_event
+
+if TYPE_CHECKING:
+    from requests import Response, Session
+    from requests.structures import CaseInsensitiveDict
 
 
 class UserRequest(NamedTuple):
@@ -23,6 +27,48 @@ class HttpParts(NamedTuple):
     content: bytes
 
 
+@cache
+def get_upstream_session() -> 'Session':
+    """
+    Returns the shared session for requests to the remote server, so
+    connections are kept alive between client requests. Cookies aren't
+    stored in the session to not share them between different clients.
+    """
+    import requests
+    session = requests.Session()
+    session.cookies.set_policy(DefaultCookiePolicy(allowed_domains=[]))
+    return session
+
+
+@cache
+def compile_words_pattern(words_length: int) -> re.Pattern:
+    """Returns the compiled pattern of words with the specific length."""
+    return re.compile(r'(?<![/|\\])(\b[a-zA-zа-яА-Я]{' + str(words_length) + r'}\b)(?![/|\\])')
+
+
+def warm_up():
+    """
+    Prepares the proxy for the traffic: imports the html parser, compiles
+    the rewrite pattern and opens a connection to the remote server. The
+    duration and the result of connecting are reported as a JSON line.
+    """
+    started_at = time.perf_counter()
+    import bs4  # noqa: F401
+    import requests
+    compile_words_pattern(settings.text_modifying['WORDS_LENGTH'])
+    error = None
+    try:
+        get_upstream_session().head(settings.proxy_settings['REQUESTED_URL'], timeout=5)
+    except requests.RequestException as exception:
+        error = f"{type(exception).__name__}: {exception}"
+    report_event(
+        'warm_up',
+        ms=round((time.perf_counter() - started_at) * 1000, 3),
+        upstream_connected=error is None,
+        error=error,
+    )
+
+
 class HttpParser:
     """The class constructs and parses http request/response."""
 
@@ -42,12 +88,20 @@ class HttpParser:
         http_part += '' if http_part.endswith('\r\n') else '\r\n'
         return http_part
 
-    @staticmethod
-    def get_plain_text_of_user_request(binary_file_of_socket: BinaryIO) -> str:
+    @classmethod
+    def get_plain_text_of_user_request(cls, binary_file_of_socket: BinaryIO) -> str:
         """
         Returns the user's request as a plain text from the binary file
         of the socket representation.
         """
+        return cls.read_user_request(binary_file_of_socket)[0]
+
+    @staticmethod
+    def read_user_request(binary_file_of_socket: BinaryIO) -> tuple[str, int]:
+        """
+        Returns the user's request as a plain text from the binary file
+        of the socket representation and the number of read bytes.
+        """
         user_request = b''
         with binary_file_of_socket as user_request_in_bytes:
             for line in user_request_in_bytes:
@@ -56,7 +110,7 @@ class HttpParser:
                 user_request += line
                 if line == b'\r\n':
                     break
-        return user_request.decode().strip()
+        return user_request.decode().strip(), len(user_request)
 
     @staticmethod
     def construct_response_status_line(
@@ -99,25 +153,16 @@ class ServerResponseHandler(HttpParser):
         """Constructs the remote server url for sending requests to it."""
         return settings.proxy_settings['REQUESTED_URL'] + asked_url
 
-    def get_modified_response_from_remote_server(self, user_request: UserRequest) -> bytes:
-        """
-        Sends a request to the remote server and returns a modified server
-        response if it is necessary.
-        """
-        server_response_data = self.send_user_request_to_server(user_request)
-        status_line, headers, content = self.get_and_modify_server_response(server_response_data)
-        return self.construct_http_response(status_line, headers, content)
-
-    def send_user_request_to_server(self, user_request: UserRequest) -> Response:
+    def send_user_request_to_server(self, user_request: UserRequest) -> 'Response':
         """Sends the client request to the remote server with changed url."""
-        server_response_data = requests.request(
+        server_response_data = get_upstream_session().request(
             user_request.method,
             self.construct_remote_server_url(user_request.url),
             headers=user_request.headers,
         )
         return server_response_data
 
-    def get_and_modify_server_response(self, server_response_data: Response) -> HttpParts:
+    def get_and_modify_server_response(self, server_response_data: 'Response') -> HttpParts:
         """
         Returns three parts of the server response: status line, headers
         and content. Headers and content are modified.
@@ -134,39 +179,38 @@ class ServerResponseHandler(HttpParser):
         headers_as_text = self.construct_response_headers(modified_headers)
         return HttpParts(status_line, headers_as_text, content)
 
-    def modify_response_content(self, content: bytes, headers: CaseInsensitiveDict) -> bytes:
+    def modify_response_content(self, content: bytes, headers: 'CaseInsensitiveDict') -> bytes:
         """
         Modifies a content of the response if it is type of `text/html`. Otherwise,
         returns how it was passed.
         """
-        content_type_of_response = headers.get("Content-Type")
-        if content_type_of_response and 'text/html' in content_type_of_response:
+        if self.is_html_response(headers):
             content = self.modify_words_in_html(content)
         return content
 
+    @staticmethod
+    def is_html_response(headers: 'CaseInsensitiveDict') -> bool:
+        """Checks whether the response content is type of `text/html`."""
+        content_type_of_response = headers.get("Content-Type")
+        return bool(content_type_of_response and 'text/html' in content_type_of_response)
+
     @staticmethod
     def modify_words_in_html(html_content: bytes | str) -> bytes:
         """
         Modifies all 6-length words in html with adding specific character
         in the end.
         """
+        from bs4 import BeautifulSoup
         html_content_in_string = html_content.decode() if isinstance(html_content, bytes) else html_content
         soup = BeautifulSoup(html_content_in_string, "html.parser")
+        words_pattern = compile_words_pattern(settings.text_modifying['WORDS_LENGTH'])
         for e in soup.find_all(string=True):
-            res = re.sub(
-                (
-                        r'(?<![/|\\])(\b[a-zA-zа-яА-Я]{' +
-                        str(settings.text_modifying['WORDS_LENGTH']) +
-                        r'}\b)(?![/|\\])'
-                ),
-                r'\1' + settings.text_modifying['ADD_CHARACTER'],
-                e.string
-            )
+            res = words_pattern.sub(r'\1' + settings.text_modifying['ADD_CHARACTER'], e.string)
             e.string.replace_with(res)
         return str(soup).encode()
 
     @staticmethod
-    def modify_response_headers(content: bytes, headers: CaseInsensitiveDict) -> CaseInsensitiveDict:
+    def modify_response_headers(content: bytes, headers: 'CaseInsensitiveDict') -> 'CaseInsensitiveDict':
         """
         Modifies headers. Set a `Content-Length` header and removes the transfer
         and the content encoding, if it was provided because we have already
@@ -229,16 +273,49 @@ class ProxyHandler(StreamRequestHandler, ServerResponseHandler, UserRequestHandl
         Handles the request from the client and returns a server response
         to him.
         """
-        user_request = self.get_user_request()
-        server_response = self.get_modified_response_from_remote_server(user_request)
-        self.send_to_user(server_response)
+        started_at = time.time()
+        timer = StageTimer()
+        user_request = server_response_data = None
+        request_size = 0
+        server_response = b''
+        rewrite_applied = False
+        try:
+            with timer.stage('parse'):
+                request_as_plain_text, request_size = self.read_user_request(self.rfile)
+                user_request = self.get_user_request(request_as_plain_text)
+            with timer.stage('upstream'):
+                server_response_data = self.send_user_request_to_server(user_request)
+            with timer.stage('rewrite'):
+                is_html_response = self.is_html_response(server_response_data.headers)
+                server_response = self.construct_http_response(
+                    *self.get_and_modify_server_response(server_response_data)
+                )
+                rewrite_applied = is_html_response
+            with timer.stage('send'):
+                self.send_to_user(server_response)
+        finally:
+            self.log_access(AccessLogRecord(
+                time=started_at,
+                method=user_request.method if user_request is not None else None,
+                url=user_request.url if user_request is not None else None,
+                status=server_response_data.status_code if server_response_data is not None else None,
+                bytes_in=request_size,
+                bytes_out=len(server_response),
+                rewrite_applied=rewrite_applied,
+                timings=timer.timings,
+            ))
+
+    def log_access(self, record: AccessLogRecord):
+        """Passes the record to the access log of the server if it is enabled."""
+        access_log = getattr(self.server, 'access_log', None)
+        if access_log:
+            access_log.log(record)
 
     def send_to_user(self, message: bytes):
         """Sends a message to the user."""
         self.wfile.write(message)
 
-    def get_user_request(self) -> UserRequest:
-        """Returns information about user's request."""
-        request_as_plain_text = self.get_plain_text_of_user_request(self.rfile)
+    def get_user_request(self, request_as_plain_text: str) -> UserRequest:
+        """Returns information about user's request from its plain text."""
         request_with_changed_host = self.change_host_in_user_request(request_as_plain_text)
         return self.parse_http_request(request_with_changed_host)
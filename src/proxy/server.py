@@ -1,6 +1,50 @@
+import json
+import time
 from socketserver import TCPServer
 
+from proxy.access_log import AccessLogWriter
+
+
+def report_event(event: str, **fields):
+    """Prints the event of the proxy lifecycle as a JSON line."""
+    print(json.dumps({'event': event, **fields}), flush=True)
+
 
 class ProxyServer(TCPServer):
     """The proxy server responsible for accepting requests."""
     allow_reuse_address = True
+
+    def __init__(self, server_address, RequestHandlerClass, bind_and_activate=True,
+                 access_log: AccessLogWriter | None = None, started_at: float | None = None):
+        self.access_log = access_log
+        self.started_at = time.perf_counter() if started_at is None else started_at
+        self.startup_metrics: dict[str, float] = {}
+        super().__init__(server_address, RequestHandlerClass, bind_and_activate)
+
+    def server_activate(self):
+        """Starts the access log writer along with the listening socket."""
+        super().server_activate()
+        if self.access_log:
+            self.access_log.start()
+        host, port = self.server_address[:2]
+        self.report_startup_metric('time_to_listen', host=host, port=port)
+
+    def server_close(self):
+        """Stops the access log writer and flushes remaining records."""
+        super().server_close()
+        if self.access_log:
+            self.access_log.stop()
+
+    def process_request(self, request, client_address):
+        """Processes the request and reports the time of the first response."""
+        super().process_request(request, client_address)
+        if 'time_to_first_response' not in self.startup_metrics:
+            self.report_startup_metric('time_to_first_response')
+
+    def report_startup_metric(self, name: str, **fields):
+        """
+        Saves milliseconds passed since the start of the proxy and prints
+        them as a JSON line with additional fields.
+        """
+        self.startup_metrics[name] = round((time.perf_counter() - self.started_at) * 1000, 3)
+        report_event('startup', metric=name, ms=self.startup_metrics[name], **fields)
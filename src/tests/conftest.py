@@ -0,0 +1,38 @@
+import pytest
+import requests
+
+from configuration.settings import settings, DEFAULT_CONFIG_PATH
+from proxy import handlers
+
+
+class FakeSession:
+
+    def __init__(self):
+        self.response: requests.Response | None = None
+        self.error: Exception | None = None
+        self.requested_urls: list[str] = []
+
+    def request(self, method, url, headers):
+        return self._respond(url)
+
+    def head(self, url, timeout):
+        return self._respond(url)
+
+    def _respond(self, url: str) -> requests.Response | None:
+        self.requested_urls.append(url)
+        if self.error:
+            raise self.error
+        return self.response
+
+
+@pytest.fixture(autouse=True)
+def default_settings():
+    settings.load_file(DEFAULT_CONFIG_PATH)
+    return settings
+
+
+@pytest.fixture
+def fake_session(monkeypatch):
+    session = FakeSession()
+    monkeypatch.setattr(handlers, 'get_upstream_session', lambda: session)
+    return session
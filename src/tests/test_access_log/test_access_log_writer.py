@@ -0,0 +1,141 @@
+import json
+import time
+
+import pytest
+
+from proxy.access_log import AccessLogRecord, AccessLogWriter, StageTimer
+
+
+def get_record(url: str = '/', handled_at: float = 1000.0) -> AccessLogRecord:
+    return AccessLogRecord(
+        time=handled_at,
+        method='GET',
+        url=url,
+        status=200,
+        bytes_in=10,
+        bytes_out=20,
+        rewrite_applied=True,
+        timings={'upstream': 1.5},
+    )
+
+
+def read_log_lines(file_path) -> list[dict]:
+    with open(file_path) as file:
+        return [json.loads(line) for line in file]
+
+
+@pytest.fixture
+def log_path(tmp_path):
+    return tmp_path / 'access.log'
+
+
+def test_records_are_written_as_json_lines_on_stop(log_path):
+    with AccessLogWriter(log_path, flush_interval=60) as access_log:
+        access_log.log(get_record('/first'))
+        access_log.log(get_record('/second'))
+    lines = read_log_lines(log_path)
+    assert [line['url'] for line in lines] == ['/first', '/second']
+    assert lines[0]['status'] == 200
+    assert lines[0]['rewrite_applied'] is True
+    assert lines[0]['timings'] == {'upstream': 1.5}
+    assert lines[0]['cache_status'] == 'NONE'
+    assert lines[0]['time'] == 1000.0
+
+
+def test_log_only_buffers_record_until_flush(log_path):
+    access_log = AccessLogWriter(log_path)
+    access_log.log(get_record())
+    assert not log_path.exists()
+    access_log.flush()
+    assert len(read_log_lines(log_path)) == 1
+
+
+def test_background_thread_writes_full_batch(log_path):
+    with AccessLogWriter(log_path, batch_size=2, flush_interval=60) as access_log:
+        access_log.log(get_record('/first'))
+        access_log.log(get_record('/second'))
+        for _ in range(100):
+            if log_path.exists() and len(read_log_lines(log_path)) == 2:
+                break
+            time.sleep(0.01)
+        assert [line['url'] for line in read_log_lines(log_path)] == ['/first', '/second']
+
+
+@pytest.mark.parametrize(
+    'options',
+    [
+        {'buffer_size': 0},
+        {'batch_size': 0},
+        {'batch_size': -1},
+        {'flush_interval': 0},
+    ]
+)
+def test_writer_rejects_non_positive_options(log_path, options):
+    with pytest.raises(ValueError):
+        AccessLogWriter(log_path, **options)
+
+
+def test_failed_write_counts_records_as_dropped_and_keeps_thread_alive(tmp_path):
+    access_log = AccessLogWriter(tmp_path / 'missing' / 'access.log', batch_size=1, flush_interval=0.01)
+    access_log.start()
+    access_log.log(get_record())
+    for _ in range(100):
+        if access_log.dropped_records:
+            break
+        time.sleep(0.01)
+    assert access_log.dropped_records == 1
+    assert access_log._thread.is_alive()
+    access_log.stop()
+    assert not (tmp_path / 'missing').exists()
+
+
+def test_overflowed_buffer_drops_oldest_records(log_path):
+    access_log = AccessLogWriter(log_path, buffer_size=2)
+    for index in range(5):
+        access_log.log(get_record(f"/{index}"))
+    access_log.flush()
+    lines = read_log_lines(log_path)
+    assert access_log.dropped_records == 3
+    assert [line['url'] for line in lines[:2]] == ['/3', '/4']
+    assert lines[2]['event'] == 'dropped'
+    assert lines[2]['count'] == 3
+    assert lines[2]['time'] > 0
+
+
+def test_record_time_is_not_changed_on_flush(log_path):
+    access_log = AccessLogWriter(log_path)
+    access_log.log(get_record('/first', handled_at=1.0))
+    access_log.log(get_record('/second', handled_at=2.5))
+    access_log.flush()
+    assert [line['time'] for line in read_log_lines(log_path)] == [1.0, 2.5]
+
+
+def test_records_not_written_on_stop_are_counted_as_dropped(tmp_path):
+    access_log = AccessLogWriter(tmp_path / 'missing' / 'access.log', batch_size=1, flush_interval=60)
+    access_log.start()
+    for index in range(3):
+        access_log.log(get_record(f"/{index}"))
+    access_log.stop()
+    assert access_log.dropped_records == 3
+
+
+def test_log_file_is_rotated_when_size_limit_is_reached(log_path):
+    access_log = AccessLogWriter(log_path, batch_size=1, max_bytes=300, backup_count=2)
+    for index in range(6):
+        access_log.log(get_record(f"/{index}"))
+        access_log.flush()
+    assert log_path.exists()
+    assert log_path.with_name('access.log.1').exists()
+    assert log_path.with_name('access.log.2').exists()
+    assert not log_path.with_name('access.log.3').exists()
+    assert log_path.stat().st_size <= 300
+
+
+def test_stage_timer_measures_stages():
+    timer = StageTimer()
+    with timer.stage('parse'):
+        pass
+    with timer.stage('send'):
+        pass
+    assert set(timer.timings) == {'parse', 'send'}
+    assert all(duration >= 0 for duration in timer.timings.values())
@@ -0,0 +1,119 @@
+import time
+from io import BytesIO
+from types import SimpleNamespace
+
+import pytest
+import requests
+from requests.structures import CaseInsensitiveDict
+
+from configuration.settings import settings
+from proxy.access_log import AccessLogRecord
+from proxy.handlers import ProxyHandler
+
+
+USER_REQUEST = b'GET /item?id=1 HTTP/1.1\r\nHost: 127.0.0.1:8888\r\nAccept: */*\r\n\r\n'
+
+
+class FakeAccessLog:
+
+    def __init__(self):
+        self.records: list[AccessLogRecord] = []
+
+    def log(self, record: AccessLogRecord):
+        self.records.append(record)
+
+
+def get_response(status_code: int, content_type: str, content: bytes) -> requests.Response:
+    response = requests.Response()
+    response.status_code = status_code
+    response.reason = 'OK'
+    response.headers = CaseInsensitiveDict({'Content-Type': content_type})
+    response._content = content
+    return response
+
+
+def get_handler(access_log: FakeAccessLog) -> ProxyHandler:
+    handler = ProxyHandler.__new__(ProxyHandler)
+    handler.server = SimpleNamespace(access_log=access_log)
+    handler.rfile = BytesIO(USER_REQUEST)
+    handler.wfile = BytesIO()
+    return handler
+
+
+@pytest.fixture(autouse=True)
+def proxy_settings(monkeypatch):
+    monkeypatch.setitem(settings.proxy_settings, 'HOST', '127.0.0.1')
+    monkeypatch.setitem(settings.proxy_settings, 'PORT', 8888)
+    monkeypatch.setitem(settings.proxy_settings, 'REQUESTED_URL', 'https://news.ycombinator.com')
+
+
+def test_handled_request_is_logged(fake_session):
+    fake_session.response = get_response(404, 'text/html', b'<p>Hello remote server</p>')
+    access_log = FakeAccessLog()
+    handler = get_handler(access_log)
+
+    started_at = time.time()
+    handler.handle()
+
+    [record] = access_log.records
+    assert record.method == 'GET'
+    assert record.url == '/item?id=1'
+    assert record.status == 404
+    assert record.bytes_in == len(USER_REQUEST)
+    assert record.bytes_out == len(handler.wfile.getvalue())
+    assert record.rewrite_applied is True
+    assert set(record.timings) == {'parse', 'upstream', 'rewrite', 'send'}
+    assert started_at <= record.time <= time.time()
+
+
+def test_not_html_response_is_logged_without_rewrite(fake_session):
+    fake_session.response = get_response(200, 'application/json', b'{}')
+    access_log = FakeAccessLog()
+
+    get_handler(access_log).handle()
+
+    assert access_log.records[0].rewrite_applied is False
+
+
+def test_failed_upstream_request_is_logged(fake_session):
+    fake_session.error = requests.ConnectionError()
+    access_log = FakeAccessLog()
+    handler = get_handler(access_log)
+
+    with pytest.raises(requests.ConnectionError):
+        handler.handle()
+
+    [record] = access_log.records
+    assert record.method == 'GET'
+    assert record.status is None
+    assert record.bytes_out == 0
+    assert handler.wfile.getvalue() == b''
+    assert set(record.timings) == {'parse', 'upstream'}
+
+
+def test_failed_request_parsing_is_logged():
+    access_log = FakeAccessLog()
+    handler = get_handler(access_log)
+    handler.rfile = BytesIO(b'\r\n')
+
+    with pytest.raises(ValueError):
+        handler.handle()
+
+    [record] = access_log.records
+    assert record.method is None
+    assert record.url is None
+    assert record.status is None
+    assert set(record.timings) == {'parse'}
+
+
+def test_failed_rewrite_is_not_logged_as_applied(fake_session):
+    fake_session.response = get_response(200, 'text/html', b'<p>\xff</p>')
+    access_log = FakeAccessLog()
+
+    with pytest.raises(UnicodeDecodeError):
+        get_handler(access_log).handle()
+
+    [record] = access_log.records
+    assert record.status == 200
+    assert record.rewrite_applied is False
+    assert record.bytes_out == 0
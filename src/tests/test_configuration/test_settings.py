@@ -2,7 +2,7 @@ from pathlib import Path
 
 import pytest
 
-from configuration.settings import settings, Settings
+from configuration.settings import settings, Settings, DEFAULT_CONFIG_PATH
 from tests.utils import get_path_to_source_file
 
 
@@ -54,3 +54,96 @@ def test_read_config_file_function_returns_all_values():
     config_data = Settings.read_config_file(get_path_to_source_file(*source_directory, 'test_config2.json'))
     assert not config_data.proxy_settings
     assert not config_data.text_modifying
+
+
+def test_load_file_changes_settings_in_place():
+    config_data = Settings({})
+    config_data.load_file(get_path_to_source_file(*source_directory, 'test_config1.json'))
+    assert config_data.proxy_settings['HOST'] == '52.12.3.145'
+    assert config_data.proxy_settings['PORT'] == 1234
+
+
+@pytest.mark.parametrize(
+    'override, section, key, value',
+    [
+        ('PROXY_SERVER.PORT=9000', 'PROXY_SERVER', 'PORT', 9000),
+        ('PROXY_SERVER.HOST=0.0.0.0', 'PROXY_SERVER', 'HOST', '0.0.0.0'),
+        ('ACCESS_LOG.ENABLED=false', 'ACCESS_LOG', 'ENABLED', False),
+        ('TEXT_MODIFYING.ADD_CHARACTER=a=b', 'TEXT_MODIFYING', 'ADD_CHARACTER', 'a=b'),
+    ]
+)
+def test_apply_overrides(override, section, key, value):
+    config_data = Settings({})
+    config_data.apply_overrides([override])
+    assert config_data.config[section][key] == value
+
+
+@pytest.mark.parametrize(
+    'override',
+    [
+        'PORT=9000',
+        'PROXY_SERVER.PORT',
+        '.PORT=1',
+        'PROXY_SERVER.=1',
+        'PROXY_SERVER.PROT=9000',
+        'FOO.BAR=1',
+        'proxy_server.PORT=9000',
+    ]
+)
+def test_apply_wrong_overrides(override):
+    with pytest.raises(ValueError):
+        Settings({}).apply_overrides([override])
+
+
+def test_validate_default_config():
+    Settings.read_config_file(DEFAULT_CONFIG_PATH).validate()
+
+
+@pytest.mark.parametrize(
+    'override',
+    [
+        'PROXY_SERVER.PORT=70000',
+        'PROXY_SERVER.PORT=0',
+        'PROXY_SERVER.PORT="8888"',
+        'PROXY_SERVER.HOST=""',
+        'PROXY_SERVER.REQUESTED_URL=news.ycombinator.com',
+        'TEXT_MODIFYING.WORDS_LENGTH=0',
+        'TEXT_MODIFYING.ADD_CHARACTER=1',
+        'PROXY_SERVER.REQUESTED_URL=https://news.ycombinator.com/',
+        'ACCESS_LOG.FILE_PATH=""',
+        'ACCESS_LOG.BUFFER_SIZE=0',
+        'ACCESS_LOG.BUFFER_SIZE="x"',
+        'ACCESS_LOG.BATCH_SIZE=0',
+        'ACCESS_LOG.BATCH_SIZE=1.5',
+        'ACCESS_LOG.FLUSH_INTERVAL=0',
+        'ACCESS_LOG.FLUSH_INTERVAL=true',
+        'ACCESS_LOG.MAX_BYTES=-1',
+        'ACCESS_LOG.BACKUP_COUNT="3"',
+    ]
+)
+def test_validate_wrong_config(override):
+    config_data = Settings.read_config_file(DEFAULT_CONFIG_PATH)
+    config_data.apply_overrides([override])
+    with pytest.raises(ValueError):
+        config_data.validate()
+
+
+def test_validate_config_without_optional_access_log_values():
+    config_data = Settings.read_config_file(DEFAULT_CONFIG_PATH)
+    config_data.load({**config_data.config, 'ACCESS_LOG': {'ENABLED': False}})
+    config_data.validate()
+
+
+@pytest.mark.parametrize(
+    'config_dict',
+    [
+        [],
+        'config',
+        {'PROXY_SERVER': 5},
+        {'TEXT_MODIFYING': []},
+        {'ACCESS_LOG': None},
+    ]
+)
+def test_load_rejects_config_of_wrong_shape(config_dict):
+    with pytest.raises(ValueError):
+        Settings(config_dict)
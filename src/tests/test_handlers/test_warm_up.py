@@ -0,0 +1,32 @@
+import json
+import sys
+
+import requests
+
+from configuration.settings import settings
+from proxy import handlers
+
+
+def test_warm_up_prepares_proxy_and_reports_it(fake_session, capsys):
+    handlers.compile_words_pattern.cache_clear()
+
+    handlers.warm_up()
+
+    assert 'bs4' in sys.modules
+    assert handlers.compile_words_pattern.cache_info().currsize == 1
+    assert fake_session.requested_urls == [settings.proxy_settings['REQUESTED_URL']]
+    event = json.loads(capsys.readouterr().out)
+    assert event['event'] == 'warm_up'
+    assert event['upstream_connected'] is True
+    assert event['error'] is None
+    assert event['ms'] >= 0
+
+
+def test_warm_up_reports_failed_connection(fake_session, capsys):
+    fake_session.error = requests.ConnectionError('refused')
+
+    handlers.warm_up()
+
+    event = json.loads(capsys.readouterr().out)
+    assert event['upstream_connected'] is False
+    assert event['error'] == 'ConnectionError: refused'
@@ -0,0 +1,119 @@
+import json
+import signal
+import socket
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+import main
+from configuration.settings import settings
+from proxy.access_log import AccessLogWriter
+from tests.utils import get_path_to_source_file
+
+
+def test_check_validates_default_config_and_exits():
+    assert main.main(['--check']) is None
+
+
+def test_config_path_and_overrides_are_loaded():
+    main.main([
+        '--check',
+        '--config', get_path_to_source_file('test_configuration', 'source', 'test_config1.json'),
+        '--set', 'PROXY_SERVER.REQUESTED_URL=https://example.com',
+        '--set', 'TEXT_MODIFYING.WORDS_LENGTH=5',
+        '-s', 'TEXT_MODIFYING.ADD_CHARACTER=!',
+    ])
+    assert settings.proxy_settings['HOST'] == '52.12.3.145'
+    assert settings.proxy_settings['PORT'] == 1234
+    assert settings.proxy_settings['REQUESTED_URL'] == 'https://example.com'
+    assert settings.text_modifying['WORDS_LENGTH'] == 5
+
+
+@pytest.mark.parametrize(
+    'arguments',
+    [
+        ['--check', '--set', 'PROXY_SERVER.PORT=abc'],
+        ['--check', '--set', 'ACCESS_LOG.BATCH_SIZE=0'],
+        ['--check', '--set', 'wrong'],
+        ['--check', '--set', 'PROXY_SERVER.PROT=9000'],
+        ['--check', '--set', 'FOO.BAR=1'],
+        ['--check', '--set', 'PROXY_SERVER.PORT=0'],
+        ['--check', '--config', 'missing_config.json'],
+        ['--check', '--config', get_path_to_source_file('test_configuration', 'source', 'test_config2.json')],
+    ]
+)
+def test_check_exits_with_error_on_wrong_config(arguments, capsys):
+    with pytest.raises(SystemExit) as exit_info:
+        main.main(arguments)
+    assert exit_info.value.code == 2
+    assert 'error' in capsys.readouterr().err
+
+
+@pytest.mark.parametrize('config_text', ['[]', '{"PROXY_SERVER": 5}', '{', ''])
+def test_check_exits_with_error_on_config_of_wrong_shape(config_text, tmp_path, capsys):
+    config_path = tmp_path / 'config.json'
+    config_path.write_text(config_text)
+    with pytest.raises(SystemExit) as exit_info:
+        main.main(['--check', '--config', str(config_path), '--set', 'PROXY_SERVER.PORT=1'])
+    assert exit_info.value.code == 2
+    assert 'error' in capsys.readouterr().err
+
+
+def test_import_does_not_load_heavy_dependencies():
+    result = subprocess.run(
+        [
+            sys.executable, '-c',
+            "import sys, main, proxy.handlers; print('requests' in sys.modules, 'bs4' in sys.modules)",
+        ],
+        cwd=Path(main.__file__).parent,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    assert result.stdout.strip() == 'False False'
+
+
+def test_access_log_gets_only_configured_options(monkeypatch):
+    monkeypatch.setattr(settings, 'access_log', {'ENABLED': True, 'FILE_PATH': 'access.log', 'BATCH_SIZE': 8})
+    access_log = main.get_access_log()
+    assert access_log.batch_size == 8
+    assert access_log.buffer_size == AccessLogWriter(access_log.file_path).buffer_size
+
+
+def test_disabled_access_log_is_not_created(monkeypatch):
+    monkeypatch.setattr(settings, 'access_log', {'ENABLED': False})
+    assert main.get_access_log() is None
+
+
+def test_sigterm_shuts_server_down_and_flushes_access_log(tmp_path):
+    with socket.socket() as free_socket:
+        free_socket.bind(('127.0.0.1', 0))
+        port = free_socket.getsockname()[1]
+    log_path = tmp_path / 'access.log'
+    process = subprocess.Popen(
+        [
+            sys.executable, main.__file__,
+            '--set', f'PROXY_SERVER.PORT={port}',
+            '--set', 'PROXY_SERVER.REQUESTED_URL=http://127.0.0.1:1',
+            '--set', f'ACCESS_LOG.FILE_PATH={log_path}',
+            '--set', 'ACCESS_LOG.FLUSH_INTERVAL=60',
+        ],
+        stdout=subprocess.PIPE,
+        stderr=subprocess.DEVNULL,
+        text=True,
+    )
+    try:
+        assert json.loads(process.stdout.readline())['metric'] == 'time_to_listen'
+        with socket.create_connection(('127.0.0.1', port)) as client:
+            client.sendall(b'GET /item HTTP/1.1\r\nHost: 127.0.0.1\r\n\r\n')
+            client.recv(1)
+        process.send_signal(signal.SIGTERM)
+        assert process.wait(timeout=10) == 0
+    finally:
+        process.kill()
+        process.stdout.close()
+    [record] = [json.loads(line) for line in log_path.read_text().splitlines()]
+    assert record['url'] == '/item'
+    assert record['status'] is None
@@ -0,0 +1,46 @@
+import json
+import socket
+from socketserver import StreamRequestHandler
+
+import pytest
+
+from proxy.server import ProxyServer
+
+
+class OkHandler(StreamRequestHandler):
+
+    def handle(self):
+        self.wfile.write(b'ok')
+
+
+def read_events(output: str) -> list[dict]:
+    return [json.loads(line) for line in output.splitlines()]
+
+
+@pytest.fixture
+def proxy_server():
+    with ProxyServer(('127.0.0.1', 0), OkHandler) as server:
+        yield server
+
+
+def send_request(server: ProxyServer) -> bytes:
+    with socket.create_connection(server.server_address) as client:
+        server.handle_request()
+        return client.recv(2)
+
+
+def test_startup_metrics_are_reported_once(capsys, proxy_server):
+    assert send_request(proxy_server) == b'ok'
+    assert send_request(proxy_server) == b'ok'
+    events = read_events(capsys.readouterr().out)
+    assert [event['metric'] for event in events] == ['time_to_listen', 'time_to_first_response']
+    assert all(event['event'] == 'startup' for event in events)
+    assert events[0]['host'] == '127.0.0.1'
+    assert events[0]['port'] == proxy_server.server_address[1] != 0
+    assert set(proxy_server.startup_metrics) == {'time_to_listen', 'time_to_first_response'}
+    assert proxy_server.startup_metrics['time_to_listen'] <= proxy_server.startup_metrics['time_to_first_response']
+
+
+def test_startup_metrics_are_counted_from_passed_start_time():
+    with ProxyServer(('127.0.0.1', 0), OkHandler, started_at=0) as server:
+        assert server.startup_metrics['time_to_listen'] > 0